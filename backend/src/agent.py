@@ -1,52 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
 import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterable
 
+import httpx
 from dotenv import load_dotenv
 from livekit.agents import (
     Agent,
     AgentSession,
+    FunctionTool,
     JobContext,
+    JobExecutorType,
     JobProcess,
     MetricsCollectedEvent,
+    ModelSettings,
     RoomInputOptions,
     WorkerOptions,
     cli,
+    llm,
     metrics,
-    tokenize,
     # function_tool,
     # RunContext
 )
 from livekit.plugins import murf, silero, google, deepgram, noise_cancellation, openai
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
+from sentence_tokenizer import FastSentenceTokenizer
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 logger = logging.getLogger("agent")
 
 load_dotenv(".env.local")
 
+# Set at import time so the job processes, which import this module, get uvloop too
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Ollama's default gemma3:12b tag is already Q4_K_M; set OLLAMA_MODEL to pick another
+# quantization, e.g. gemma3:12b-it-q4_0 on CPU-only hosts
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "gemma3:12b")
+# Only applies to the priming request: per-turn requests go through the
+# OpenAI-compatible endpoint, which sends no keep_alive, so Ollama falls back to its
+# own default (5m) after the first turn. Set OLLAMA_KEEP_ALIVE on the Ollama host to
+# keep the model loaded between calls.
+PRIME_KEEP_ALIVE = os.environ.get("PRIME_KEEP_ALIVE", "24h")
+
+# Jobs run as threads of one worker process by default so they share the VAD weights
+# and the response cache; set to "process" to isolate each call in its own process
+JOB_EXECUTOR_TYPE = JobExecutorType(os.environ.get("JOB_EXECUTOR_TYPE", "thread"))
+
+INSTRUCTIONS = """You are Ruby, a cybersecurity expert and virtual penetration tester. You explain security concepts and vulnerabilities and share tips on staying safe.
+If asked who made you, say you were created by Vasanth.
+If asked how you are built: LiveKit for real-time voice, Murf Falcon for text-to-speech, Deepgram for speech-to-text, and Gemma 3 (12B) on Ollama as your local LLM.
+Talk like an expert chatting with a colleague: curious, friendly, a little funny. Answer directly with no preamble, and keep it short unless the user asks for detail or the topic needs it. Use industry terms, but explain them.
+You are heard, not read: use short, plain sentences that are easy to listen to."""
+
+# Trivial turns whose answer never depends on the conversation get a fixed reply
+# instead of a full LLM generation
+_DIRECT_REPLIES = {
+    "creator": (
+        r"who (?:made|created|built|designed) you",
+        "I was created by Vasanth.",
+    ),
+    "thanks": (
+        r"(?:thanks|thank you)(?: so much| a lot)?(?: ruby)?",
+        "You're welcome! Anything else you want to dig into?",
+    ),
+    "bye": (
+        r"(?:bye|goodbye|see you)(?: ruby)?",
+        "Bye! Stay safe out there.",
+    ),
+}
+_DIRECT_PATTERN = re.compile(
+    r"^\s*(?:"
+    + "|".join(
+        f"(?P<{name}>{pattern})" for name, (pattern, _) in _DIRECT_REPLIES.items()
+    )
+    + r")[\s.!?]*$",
+    re.IGNORECASE,
+)
+
+# Replies are cached per process, keyed on the user's turn and the reply before it,
+# so questions repeated across calls skip the local LLM entirely. Jobs share the
+# cache because they run as threads of one worker process (JOB_EXECUTOR_TYPE)
+RESPONSE_CACHE_SIZE = 256
+
+_response_cache: OrderedDict[str, str] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _user_turn(chat_ctx: llm.ChatContext) -> tuple[str, str] | None:
+    """Return (previous assistant reply, user text) if the context ends on a user turn."""
+    messages = [item for item in chat_ctx.items if item.type == "message"]
+    if not messages or messages[-1].role != "user" or not messages[-1].text_content:
+        return None
+
+    previous = ""
+    if len(messages) > 1 and messages[-2].role == "assistant":
+        previous = messages[-2].text_content or ""
+
+    return previous, messages[-1].text_content
+
+
+def _direct_reply(chat_ctx: llm.ChatContext) -> str | None:
+    turn = _user_turn(chat_ctx)
+    match = _DIRECT_PATTERN.match(turn[1]) if turn else None
+    return _DIRECT_REPLIES[match.lastgroup][1] if match else None
+
+
+# Turns that follow one of these mean the same thing in any conversation
+_CONTEXT_FREE_REPLIES = {""} | {reply for _, reply in _DIRECT_REPLIES.values()}
+
+
+def _cache_key(chat_ctx: llm.ChatContext) -> str | None:
+    turn = _user_turn(chat_ctx)
+    # A follow-up like "yes" after a generated reply depends on the whole topic, so
+    # only turns that open the call or follow a fixed reply are cached
+    if turn is None or turn[0] not in _CONTEXT_FREE_REPLIES:
+        return None
+
+    text = f"{turn[0]}\n{_normalize(turn[1])}"
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    with _response_cache_lock:
+        reply = _response_cache.get(key)
+        if reply is not None:
+            _response_cache.move_to_end(key)
+        return reply
+
+
+def _cache_put(key: str, reply: str) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = reply
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
 
 class Assistant(Agent):
     def __init__(self) -> None:
         super().__init__(
-            instructions="""You are Ruby, a cybersecurity expert and virtual penetration tester. You help users understand security concepts, explain vulnerabilities, and provide tips on staying safe.
-            
-            **Who made you?**
-            If asked who designed or made you, you must answer that you were created by **Vasanth**.
-
-            **How are you made?**
-            If asked how you are built or what technologies you use, explain that you are built using:
-            - **LiveKit** for real-time voice capabilities.
-            - **Murf Falcon** for ultra-fast text-to-speech (TTS).
-            - **Deepgram** for speech-to-text (STT).
-            - **Ollama running Gemma 3 (12B)** as your local LLM brain.
-
-            **Style & Tone:**
-            - **Be Conversational:** Speak naturally, like a human expert chatting with a colleague. Avoid robotic or essay-like responses.
-            - **Be Concise:** Give short, direct answers by default. Only provide detailed, long explanations if the user explicitly asks for them or if the topic is complex and requires it.
-            - **No Fluff:** Skip introductions like "Here is the answer" or "That is a great question." Just answer.
-            - **Personality:** You are curious, friendly, and have a sense of humor. Use industry terminology where appropriate but explain it clearly if needed.
-            
-            Your responses should be optimized for voice interaction—short sentences, clear structure, and easy to listen to.""",
+            instructions=INSTRUCTIONS,
         )
 
+    async def llm_node(
+        self,
+        chat_ctx: llm.ChatContext,
+        tools: list[FunctionTool],
+        model_settings: ModelSettings,
+    ) -> AsyncIterable[llm.ChatChunk | str]:
+        reply = _direct_reply(chat_ctx)
+        if reply is not None:
+            logger.debug("serving direct reply")
+            yield reply
+            return
+
+        key = _cache_key(chat_ctx)
+        reply = _cache_get(key) if key is not None else None
+        if reply is not None:
+            logger.debug("serving cached reply")
+            yield reply
+            return
+
+        # Only complete, plain-text replies are cached; tool calls must always run
+        cacheable = key is not None
+        parts: list[str] = []
+        async for chunk in Agent.default.llm_node(
+            self, chat_ctx, tools, model_settings
+        ):
+            if isinstance(chunk, str):
+                parts.append(chunk)
+            elif chunk.delta is not None:
+                if chunk.delta.tool_calls:
+                    cacheable = False
+                if chunk.delta.content:
+                    parts.append(chunk.delta.content)
+            yield chunk
+
+        if cacheable and parts:
+            _cache_put(key, "".join(parts))
+
     # To add tools, use the @function_tool decorator.
     # Here's an example that adds a simple weather tool.
     # You also have to add `from livekit.agents import function_tool, RunContext` to the top of this file
@@ -65,8 +216,54 @@ class Assistant(Agent):
     #     return "sunny with a temperature of 70 degrees."
 
 
+def _prime_ollama() -> None:
+    # Loading the model and prefilling the static system prompt once lets Ollama
+    # reuse the prompt's KV cache instead of re-prefilling it on every turn
+    try:
+        resp = httpx.post(
+            f"{OLLAMA_BASE_URL}/api/chat",
+            json={
+                "model": OLLAMA_MODEL,
+                "messages": [{"role": "system", "content": INSTRUCTIONS}],
+                "stream": False,
+                "keep_alive": PRIME_KEEP_ALIVE,
+                "options": {"num_predict": 1},
+            },
+            timeout=120,
+        )
+        resp.raise_for_status()
+        prompt_tokens = resp.json().get("prompt_eval_count")
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning(f"Failed to prime Ollama: {e}")
+        return
+
+    logger.info(f"Primed {OLLAMA_MODEL} with {prompt_tokens} prompt tokens")
+
+
+_vad_lock = threading.Lock()
+_base_vad: silero.VAD | None = None
+
+
+def _load_vad() -> silero.VAD:
+    """Return a VAD for one job, loading the Silero weights once per process.
+
+    Jobs running as threads of one process (JOB_EXECUTOR_TYPE=thread) share the ONNX
+    session, which is thread-safe. Each job still gets its own VAD: it is an event
+    emitter, and a shared one would send every job's VAD metrics to every session.
+    """
+    global _base_vad
+    with _vad_lock:
+        if _base_vad is None:
+            _base_vad = silero.VAD.load()
+    return silero.VAD(
+        session=_base_vad._onnx_session, opts=dataclasses.replace(_base_vad._opts)
+    )
+
+
 def prewarm(proc: JobProcess):
-    proc.userdata["vad"] = silero.VAD.load()
+    proc.userdata["vad"] = _load_vad()
+    # Run in the background so a cold model load can't exceed the process init timeout
+    threading.Thread(target=_prime_ollama, daemon=True).start()
 
 
 async def entrypoint(ctx: JobContext):
@@ -85,8 +282,8 @@ async def entrypoint(ctx: JobContext):
         # A Large Language Model (LLM) is your agent's brain, processing user input and generating a response
         # See all available models at https://docs.livekit.io/agents/models/llm/
         llm=openai.LLM(
-                base_url="http://localhost:11434/v1",
-                model="gemma3:12b",
+                base_url=f"{OLLAMA_BASE_URL}/v1",
+                model=OLLAMA_MODEL,
                 api_key="ollama",
             ),
         # Text-to-speech (TTS) is your agent's voice, turning the LLM's text into speech that the user can hear
@@ -94,8 +291,10 @@ async def entrypoint(ctx: JobContext):
         tts=murf.TTS(
                 voice="en-US-matthew", 
                 style="Conversation",
-                tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
-                text_pacing=True
+                # Flush long sentences at clause boundaries so the first audio
+                # doesn't wait for the LLM to finish a whole sentence
+                tokenizer=FastSentenceTokenizer(min_sentence_len=2, min_clause_len=40),
+                text_pacing=False
             ),
         # VAD and turn detection are used to determine when the user is speaking and when the agent should respond
         # See more at https://docs.livekit.io/agents/build/turns
@@ -104,6 +303,11 @@ async def entrypoint(ctx: JobContext):
         # allow the LLM to generate a response while waiting for the end of turn
         # See more at https://docs.livekit.io/agents/build/audio/#preemptive-generation
         preemptive_generation=True,
+        # Commit the turn soon after the turn detector is confident the user is done,
+        # and let short barge-ins stop the agent
+        min_endpointing_delay=0.15,
+        max_endpointing_delay=3.0,
+        min_interruption_duration=0.15,
     )
 
     # To use a realtime model instead of a voice pipeline, use the following session setup instead.
@@ -122,7 +326,10 @@ async def entrypoint(ctx: JobContext):
 
     @session.on("metrics_collected")
     def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
+        # Formatting and writing a log line for every metrics event adds up on long
+        # calls, so only do it when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            metrics.log_metrics(ev.metrics, logger=logger)
         usage_collector.collect(ev.metrics)
 
     async def log_usage():
@@ -154,4 +361,10 @@ async def entrypoint(ctx: JobContext):
 
 
 if __name__ == "__main__":
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
+    cli.run_app(
+        WorkerOptions(
+            entrypoint_fnc=entrypoint,
+            prewarm_fnc=prewarm,
+            job_executor_type=JOB_EXECUTOR_TYPE,
+        )
+    )
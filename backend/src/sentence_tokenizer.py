@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import functools
+import re
+
+from livekit.agents import tokenize
+
+# Terminal punctuation plus any closing quotes/brackets, or a clause mark (, ; :),
+# followed by whitespace. The lookbehinds sit after the punctuation so they only run
+# at candidate boundaries; they skip ellipses, single letters ("U.S.", "e.g.",
+# initials) and common abbreviations, like tokenize.basic does.
+_BOUNDARY = re.compile(
+    r"(?:[.!?]+"
+    r"(?<!\.\.)(?<!\b[A-Za-z]\.)"
+    r"(?<!\bMr\.)(?<!\bMrs\.)(?<!\bMs\.)(?<!\bDr\.)(?<!\bSt\.)"
+    r"(?<!\bInc\.)(?<!\bLtd\.)(?<!\bJr\.)(?<!\bSr\.)(?<!\bCo\.)"
+    r"(?<!\bvs\.)(?<!\betc\.)"
+    r"[\"'\u201d\u2019)\]]*|(?P<clause>[,;:]))\s+"
+)
+
+
+def split_sentences(
+    text: str, min_sentence_len: int = 20, min_clause_len: int | None = None
+) -> list[tuple[str, int, int]]:
+    """Split text into (sentence, start, end) tuples with a single regex scan.
+
+    Sentences shorter than min_sentence_len are merged into the next one. When
+    min_clause_len is set, text is also split at , ; or : once it is that long.
+    """
+    sentences: list[tuple[str, int, int]] = []
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        sentence = text[start : match.end()].strip()
+        if match.group("clause"):
+            if min_clause_len is None or len(sentence) < min_clause_len:
+                continue
+        elif len(sentence) <= min_sentence_len:
+            continue
+
+        sentences.append((sentence, start, match.end()))
+        start = match.end()
+
+    if rest := text[start:].strip():
+        sentences.append((rest, start, len(text)))
+
+    return sentences
+
+
+class FastSentenceTokenizer(tokenize.SentenceTokenizer):
+    """Replacement for tokenize.basic.SentenceTokenizer on the TTS hot path.
+
+    The basic tokenizer runs a dozen regex substitutions over the whole buffer
+    every time the LLM streams a chunk; this one does one precompiled scan.
+    Set min_clause_len to also flush long sentences at clause boundaries, so
+    the first audio doesn't wait for a full sentence.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_sentence_len: int = 20,
+        min_clause_len: int | None = None,
+        stream_context_len: int = 10,
+    ) -> None:
+        self._min_sentence_len = min_sentence_len
+        self._min_clause_len = min_clause_len
+        self._stream_context_len = stream_context_len
+
+    def tokenize(self, text: str, *, language: str | None = None) -> list[str]:
+        return [
+            tok[0]
+            for tok in split_sentences(
+                text, self._min_sentence_len, self._min_clause_len
+            )
+        ]
+
+    def stream(self, *, language: str | None = None) -> tokenize.SentenceStream:
+        return tokenize.BufferedSentenceStream(
+            tokenizer=functools.partial(
+                split_sentences,
+                min_sentence_len=self._min_sentence_len,
+                min_clause_len=self._min_clause_len,
+            ),
+            min_token_len=self._min_sentence_len,
+            min_ctx_len=self._stream_context_len,
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import google.generativeai as genai
 from dotenv import load_dotenv
@@ -15,32 +16,43 @@ if not api_key:
 
 genai.configure(api_key=api_key)
 
+models_to_test = [
+    "gemini-2.0-flash-exp",
+    "gemini-1.5-flash",
+    "gemini-1.5-pro",
+    "gemini-2.0-flash-thinking-exp-01-21",
+    "gemini-2.0-pro-exp-02-05"
+]
+
+
+async def probe(model_name):
+    model = genai.GenerativeModel(model_name)
+    response = await model.generate_content_async("Hello, are you working?")
+    return response.text
+
+
+async def probe_all():
+    # Probe every model at once, so the wait is the slowest model rather than the sum
+    return await asyncio.gather(
+        *(probe(model_name) for model_name in models_to_test), return_exceptions=True
+    )
+
+
 print("Listing available models...")
 try:
     for m in genai.list_models():
         if 'generateContent' in m.supported_generation_methods:
             print(f"- {m.name}")
-            
-    models_to_test = [
-        "gemini-2.0-flash-exp",
-        "gemini-1.5-flash",
-        "gemini-1.5-pro",
-        "gemini-2.0-flash-thinking-exp-01-21",
-        "gemini-2.0-pro-exp-02-05"
-    ]
 
     print("\nTesting models...")
     working_model = None
-    for model_name in models_to_test:
-        print(f"Testing '{model_name}'...")
-        try:
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content("Hello, are you working?")
-            print(f"SUCCESS: {model_name} responded: {response.text}")
-            working_model = model_name
-            break
-        except Exception as e:
-            print(f"FAILED: {model_name} - {e}")
+    for model_name, result in zip(models_to_test, asyncio.run(probe_all())):
+        if isinstance(result, Exception):
+            print(f"FAILED: {model_name} - {result}")
+        else:
+            print(f"SUCCESS: {model_name} responded: {result}")
+            # Keep the first working model in order of preference
+            working_model = working_model or model_name
             
     if working_model:
         print(f"\nRECOMMENDATION: Use '{working_model}'")
@@ -1,18 +1,48 @@
+import asyncio
+import os
+
+import httpx
 import openai
+from dotenv import load_dotenv
+
+load_dotenv(".env.local")
+
+model = os.getenv("OLLAMA_MODEL", "gemma3:12b")
+
+# Sent concurrently over one pooled client. Ollama only answers them in parallel
+# when the server is started with OLLAMA_NUM_PARALLEL > 1 (e.g. 8).
+prompts = [
+    "Hello, are you working?",
+    "In one sentence, what is phishing?",
+    "In one sentence, what is a firewall?",
+]
+
+
+async def main():
+    async with openai.AsyncOpenAI(
+        base_url=f"{os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')}/v1",
+        api_key="ollama",
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=16)
+        ),
+    ) as client:
+        responses = await asyncio.gather(
+            *(
+                client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                for prompt in prompts
+            ),
+            return_exceptions=True,
+        )
+
+    for prompt, response in zip(prompts, responses):
+        if isinstance(response, Exception):
+            print(f"FAILED: {prompt!r} - {response}")
+        else:
+            print(f"SUCCESS: {prompt!r} - {response.choices[0].message.content}")
 
-client = openai.OpenAI(
-    base_url="http://localhost:11434/v1",
-    api_key="ollama"
-)
 
 print("Testing Ollama connection...")
-try:
-    response = client.chat.completions.create(
-        model="gemma3:12b",
-        messages=[
-            {"role": "user", "content": "Hello, are you working?"}
-        ]
-    )
-    print(f"SUCCESS: Response: {response.choices[0].message.content}")
-except Exception as e:
-    print(f"FAILED: {e}")
+asyncio.run(main())
@@ -0,0 +1,122 @@
+from collections import OrderedDict
+
+import pytest
+from livekit.agents import Agent, llm
+
+import agent
+from agent import Assistant, _cache_key, _direct_reply
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Replace the real LLM node with one that replays scripted chunks."""
+    calls: list[llm.ChatContext] = []
+    script: list[list[llm.ChatChunk | str]] = []
+
+    async def llm_node(agent, chat_ctx, tools, model_settings):
+        calls.append(chat_ctx)
+        for chunk in script.pop(0):
+            yield chunk
+
+    monkeypatch.setattr(Agent.default, "llm_node", llm_node)
+    monkeypatch.setattr(agent, "_response_cache", OrderedDict())
+    return calls, script
+
+
+def _chat(*texts: str) -> llm.ChatContext:
+    ctx = llm.ChatContext()
+    for i, text in enumerate(texts):
+        ctx.add_message(role="user" if i % 2 == 0 else "assistant", content=text)
+    return ctx
+
+
+async def _reply(ctx: llm.ChatContext) -> list[llm.ChatChunk | str]:
+    return [chunk async for chunk in Assistant().llm_node(ctx, [], None)]
+
+
+def test_cache_key_ignores_case_and_whitespace() -> None:
+    a = llm.ChatContext()
+    a.add_message(role="user", content="What is  XSS?")
+    b = llm.ChatContext()
+    b.add_message(role="user", content="what is xss?")
+
+    assert _cache_key(a) is not None
+    assert _cache_key(a) == _cache_key(b)
+
+
+def test_follow_ups_to_generated_replies_are_not_cached() -> None:
+    assert _cache_key(_chat("What is XSS?", "Want an example?", "Yes")) is None
+
+
+def test_turns_after_fixed_replies_share_a_key() -> None:
+    welcome = "You're welcome! Anything else you want to dig into?"
+    a = _chat("Thanks", welcome, "What is XSS?")
+    b = _chat("Thank you so much", welcome, "what is xss?")
+
+    assert _cache_key(a) is not None
+    assert _cache_key(a) == _cache_key(b)
+    assert _cache_key(a) != _cache_key(_chat("What is XSS?"))
+
+
+def test_cache_key_requires_user_turn() -> None:
+    ctx = llm.ChatContext()
+    ctx.add_message(role="assistant", content="Hi, I'm Ruby.")
+
+    assert _cache_key(ctx) is None
+
+
+def test_direct_reply_for_trivial_turns() -> None:
+    ctx = llm.ChatContext()
+    ctx.add_message(role="user", content="Who made you?")
+
+    assert _direct_reply(ctx) == "I was created by Vasanth."
+
+
+def test_no_direct_reply_for_real_questions() -> None:
+    ctx = llm.ChatContext()
+    ctx.add_message(role="user", content="Thanks, but how does a CSRF token work?")
+
+    assert _direct_reply(ctx) is None
+
+
+async def test_llm_node_serves_repeated_question_from_cache(fake_llm) -> None:
+    calls, script = fake_llm
+    script.append(["XSS is ", "script injection."])
+
+    assert await _reply(_chat("What is XSS?")) == ["XSS is ", "script injection."]
+    assert await _reply(_chat("what is  xss?")) == ["XSS is script injection."]
+    assert len(calls) == 1
+
+
+async def test_llm_node_does_not_cache_tool_calls(fake_llm) -> None:
+    calls, script = fake_llm
+    tool_call = llm.ChatChunk(
+        id="1",
+        delta=llm.ChoiceDelta(
+            role="assistant",
+            content="Checking.",
+            tool_calls=[
+                llm.FunctionToolCall(name="lookup", arguments="{}", call_id="1")
+            ],
+        ),
+    )
+    script.extend([[tool_call], [tool_call]])
+
+    await _reply(_chat("Look it up"))
+    await _reply(_chat("Look it up"))
+    assert len(calls) == 2
+
+
+async def test_llm_node_evicts_least_recently_used(fake_llm, monkeypatch) -> None:
+    calls, script = fake_llm
+    monkeypatch.setattr(agent, "RESPONSE_CACHE_SIZE", 2)
+    script.extend([["A"], ["B"], ["C"], ["A again"]])
+
+    await _reply(_chat("a"))
+    await _reply(_chat("b"))
+    await _reply(_chat("a"))  # hit, so "b" is now the oldest entry
+    await _reply(_chat("c"))
+
+    assert await _reply(_chat("a")) == ["A"]
+    assert await _reply(_chat("b")) == ["A again"]
+    assert len(calls) == 4
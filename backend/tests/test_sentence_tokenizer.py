@@ -0,0 +1,83 @@
+from sentence_tokenizer import FastSentenceTokenizer, split_sentences
+
+
+def test_splits_on_terminal_punctuation() -> None:
+    text = "SQL injection is bad. Always use prepared statements! Got it?"
+
+    assert FastSentenceTokenizer(min_sentence_len=2).tokenize(text) == [
+        "SQL injection is bad.",
+        "Always use prepared statements!",
+        "Got it?",
+    ]
+
+
+def test_keeps_titles_and_decimals_together() -> None:
+    text = "Ask Dr. Smith about TLS 1.3 today. Then patch."
+
+    assert [s for s, _, _ in split_sentences(text, min_sentence_len=2)] == [
+        "Ask Dr. Smith about TLS 1.3 today.",
+        "Then patch.",
+    ]
+
+
+def test_keeps_acronyms_and_abbreviations_together() -> None:
+    tokenizer = FastSentenceTokenizer(min_sentence_len=2)
+
+    assert tokenizer.tokenize("The U.S. government runs CISA. Neat.") == [
+        "The U.S. government runs CISA.",
+        "Neat.",
+    ]
+    assert tokenizer.tokenize(
+        "Use a proxy, e.g. Burp, i.e. a MITM tool. Try ZAP vs. Burp, etc. today."
+    ) == [
+        "Use a proxy, e.g. Burp, i.e. a MITM tool.",
+        "Try ZAP vs. Burp, etc. today.",
+    ]
+
+
+def test_does_not_split_on_ellipsis() -> None:
+    assert FastSentenceTokenizer(min_sentence_len=2).tokenize(
+        "Wait... what? It worked."
+    ) == ["Wait... what?", "It worked."]
+
+
+def test_merges_short_sentences() -> None:
+    assert FastSentenceTokenizer(min_sentence_len=20).tokenize(
+        "Yes. That is a phishing email."
+    ) == ["Yes. That is a phishing email."]
+
+
+def test_offsets_cover_source_text() -> None:
+    text = "First one here.  Second one here. Trailing"
+
+    assert [(start, end) for _, start, end in split_sentences(text, 2)] == [
+        (0, 17),
+        (17, 34),
+        (34, len(text)),
+    ]
+
+
+async def test_stream_emits_sentences_as_they_complete() -> None:
+    stream = FastSentenceTokenizer(min_sentence_len=2).stream()
+    for chunk in ["Phishing is ", "common. Use ", "MFA everywhere."]:
+        stream.push_text(chunk)
+    stream.end_input()
+
+    assert [ev.token async for ev in stream] == [
+        "Phishing is common.",
+        "Use MFA everywhere.",
+    ]
+
+
+def test_clause_splitting_waits_for_min_length() -> None:
+    tokenizer = FastSentenceTokenizer(min_sentence_len=2, min_clause_len=40)
+    text = (
+        "Sure, here goes. A firewall filters traffic between networks, "
+        "and it blocks anything your rules don't allow."
+    )
+
+    assert tokenizer.tokenize(text) == [
+        "Sure, here goes.",
+        "A firewall filters traffic between networks,",
+        "and it blocks anything your rules don't allow.",
+    ]